@@ -13,24 +13,155 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import base64
+import functools
+import hashlib
+import ipaddress
 import json
 import re
+import sys
+import time
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional
-
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from html import unescape
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+
+import httpx
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Playwright,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+try:
+    # RE2 gives linear-time scans over multi-MB page HTML; the stdlib engine is
+    # a drop-in fallback for the patterns below.
+    import re2 as scan_re
+except ImportError:
+    scan_re = re
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 NODE_URLS = [
     "http://node1.gonka.ai:8000",
     "http://node2.gonka.ai:8000",
 ]
+NODE_API_PATH = "/v1/epochs/current/participants"
 
 DISCORD_URL = "https://discord.com/invite/RADwCT2U6R"
 X_URL = "https://x.com/gonka_ai"
 GITHUB_URL = "https://github.com/gonka-ai/gonka/"
+GITHUB_API_URL = "https://api.github.com/repos/gonka-ai/gonka"
 HEX_URL = "https://hex.exchange/otc/gonka38261660"
 
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+HTTP_CONNECT_RETRIES = 2
+
+# Resources the parsers never read; aborting them keeps page loads small.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_HOSTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "segment.io",
+    "segment.com",
+)
+
+# Hop-by-hop/encoding headers that no longer describe a cached (decoded) body.
+UNCACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+WHITESPACE_RE = re.compile(r"\s+")
+CLEAN_SPACES_CACHE_MAX_LEN = 256
+NON_DIGIT_RE = re.compile(r"\D")
+# Number tokens are digit groups joined by separators rather than one
+# "[\d\s.,]*" run followed by "\s*", whose overlapping classes backtrack
+# on every near-miss.
+NUMBER = r"\d+(?:[\s\xa0.,]+\d+)*"
+TRAILING_NUMBER_RE = scan_re.compile(rf"({NUMBER})\s*$")
+COMPACT_NUMBER_RE = re.compile(NUMBER + r"(?:\s*(?:k|m|тыс\.?|млн\.?))?", re.IGNORECASE)
+THOUSANDS_SUFFIX_RE = re.compile(r"тыс\.?$", re.IGNORECASE)
+MILLIONS_SUFFIX_RE = re.compile(r"млн\.?$", re.IGNORECASE)
+POC_HOURS_RE = re.compile(r"(\d+)\s*h", re.IGNORECASE)
+POC_MINUTES_RE = re.compile(r"(\d+)\s*m", re.IGNORECASE)
+POC_SECONDS_RE = re.compile(r"(\d+)\s*s", re.IGNORECASE)
+GITHUB_STARS_TEXT_RE = re.compile(rf"({NUMBER}(?:\s*[km])?)\s*stars?", re.IGNORECASE)
+# All price markers in one alternation, so the page text is scanned once;
+# the group name tells which marker matched.
+HEX_PRICE_RE = re.compile(
+    r"(?:Sell\s*Price|Цена\s*продажи)\s*[:]?\s*\$?\s*(?P<sell>\d+(?:[.,]\d+)*)"
+    r"|(?:Buy\s*Price|Цена\s*покупки)\s*[:]?\s*\$?\s*(?P<buy>\d+(?:[.,]\d+)*)"
+    r"|\$\s*(?P<dollar>\d+(?:[.,]\d+)*)",
+    re.IGNORECASE,
+)
+HEX_PRICE_PRIORITY = ("sell", "buy", "dollar")
+
+# Scans over raw page HTML. Flags are inline so the patterns compile under
+# both RE2 and the stdlib engine.
+HTML_SKIP_BLOCK_RE = scan_re.compile(
+    r"(?is)<script\b.*?</script>|<style\b.*?</style>|<noscript\b.*?</noscript>"
+)
+HTML_TAG_RE = scan_re.compile(r"<[^>]+>")
+GITHUB_STARS_ATTR_RE = scan_re.compile(r'id="repo-stars-counter-star"[^>]*\btitle="([\d,]+)"')
+# Discord counts are found by locating the label first and matching the
+# number only in a short window before it; a "number then label" pattern
+# restarts inside every digit run of a multi-MB page.
+DISCORD_LABEL_RE = scan_re.compile(r"(?i)(?P<online>в\s*сети|online)|(?P<members>участник|members?)")
+
+# The dashboard renders its labels before the values arrive; wait until the
+# cards the parser reads carry numbers.
+NODE_READY_JS = r"""
+() => {
+  const text = document.body ? document.body.innerText : "";
+  return /Total Compute Power\D{0,120}\d/i.test(text) && /Validators\D{0,120}\d/i.test(text);
+}
+"""
+
+# ETag and decoded body of the last JSON response per URL, so repeat polls in
+# --interval mode revalidate with If-None-Match and get an empty 304 back.
+JSON_ETAGS: Dict[str, tuple[str, Any]] = {}
+
+# Upper bound for one --processes worker: the slowest section (a node
+# navigation plus its waits) with headroom for the browser launch.
+WORKER_TIMEOUT = 180.0
+
+# One page per node plus Discord, X and the HEX browser fallback.
+PAGE_POOL_SIZE = len(NODE_URLS) + 3
+
+# Containers scanned before the whole body; the body is still scanned when
+# the container exists but does not hold the value.
+DISCORD_TEXT_SELECTORS = ["main"]
+HEX_TEXT_SELECTORS = ["main"]
+
+# Targeted reads that return only the elements holding the values, instead
+# of shipping the whole page over CDP.
+DISCORD_COUNTS_JS = """
+() => {
+  const el = document.querySelector("[class*='activityCount']");
+  return el ? el.textContent : null;
+}
+"""
+HEX_PRICE_LABELS = ("Sell Price", "Цена продажи")
+
+T = TypeVar("T")
+
 
 @dataclass
 class NodeMetrics:
@@ -68,20 +199,234 @@ class HexMetrics:
     error: Optional[str] = None
 
 
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class DiskCache:
+    """Response cache stored as one JSON file per URL under ``cache_dir/<host>/``."""
+
+    def __init__(self, cache_dir: str = ".cache", ttl: float = 300) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        parts = urlsplit(url)
+        host = (parts.netloc or "_").replace(":", "_")
+        key = hashlib.sha1(f"{parts.path}?{parts.query}".encode()).hexdigest()
+        return self.cache_dir / host / f"{key}.json"
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        try:
+            entry = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or time.time() - entry.get("timestamp", 0) > self.ttl:
+            return None
+        return CachedResponse(
+            status=entry["status"],
+            headers=entry["headers"],
+            body=base64.b64decode(entry["body"]),
+        )
+
+    def set(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        path = self._path(url)
+        entry = {
+            "url": url,
+            "timestamp": time.time(),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in UNCACHED_HEADERS},
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            pass
+
+
+class PagePool:
+    """Pages handed out to concurrent parsers and reused between runs.
+
+    The pool holds ``size`` slots; a slot carries a reusable page or None
+    when its page still has to be opened. Playwright and the browser start on
+    the first acquire(), so sections that never render a page (GitHub, HEX
+    when its HTML carries the price) run without Chromium. A browser that
+    crashes or disconnects is relaunched by the next acquire().
+    """
+
+    def __init__(
+        self,
+        profile_dir: str,
+        headless: bool = True,
+        cache: Optional[DiskCache] = None,
+        size: int = PAGE_POOL_SIZE,
+    ) -> None:
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.cache = cache
+        self.size = size
+        self.context: Optional[BrowserContext] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._starting: Optional[asyncio.Future[None]] = None
+        self._context_lost = False
+        self._spare_pages: list[Page] = []
+        self._slots: asyncio.Queue[Optional[Page]] = asyncio.Queue()
+        for _ in range(size):
+            self._slots.put_nowait(None)
+
+    async def _start(self) -> None:
+        try:
+            self._playwright = await self._start_playwright()
+            self._browser, self.context = await launch_context(self._playwright, self.profile_dir, self.headless)
+            self.context.on("close", self._on_context_close)
+            await self.context.route("**/*", make_route_handler(self.cache))
+            # Persistent contexts open with a blank tab already; reuse it.
+            self._spare_pages = list(self.context.pages)
+        except BaseException:
+            await self._teardown()
+            raise
+
+    @staticmethod
+    async def _start_playwright() -> Playwright:
+        # A driver abandoned mid-start keeps its connection task and process
+        # alive with nothing left to stop them, so a cancellation waits for the
+        # start to finish and stops the driver before re-raising.
+        starting = asyncio.ensure_future(async_playwright().start())
+        try:
+            return await asyncio.shield(starting)
+        except asyncio.CancelledError:
+            with suppress(Exception):
+                await (await starting).stop()
+            raise
+
+    def _on_context_close(self, context: BrowserContext) -> None:
+        if context is self.context:
+            self._context_lost = True
+
+    async def _teardown(self) -> None:
+        context, browser, playwright = self.context, self._browser, self._playwright
+        self.context = self._browser = self._playwright = None
+        self._spare_pages = []
+        for closer in (
+            context.close if context else None,
+            browser.close if browser else None,
+            playwright.stop if playwright else None,
+        ):
+            if closer is not None:
+                with suppress(Exception):
+                    await closer()
+
+    async def _ensure_started(self) -> None:
+        if self._context_lost:
+            self._context_lost = False
+            self._starting = None
+            await self._teardown()
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        starting = self._starting
+        try:
+            # Shielded so a cancelled caller does not abort a launch that
+            # other parsers are waiting on.
+            await asyncio.shield(starting)
+        except Exception:
+            if self._starting is starting:
+                self._starting = None
+            raise
+
+    async def acquire(self) -> Page:
+        page = await self._slots.get()
+        try:
+            await self._ensure_started()
+            if page is None or page.is_closed():
+                if self._spare_pages:
+                    page = self._spare_pages.pop()
+                else:
+                    try:
+                        page = await self.context.new_page()
+                    except Exception:
+                        # A context that cannot open pages is gone; relaunch
+                        # on the next acquire().
+                        self._context_lost = True
+                        raise
+            return page
+        except BaseException:
+            self._slots.put_nowait(None)
+            raise
+
+    async def release(self, page: Page) -> None:
+        reset = False
+        try:
+            await page.goto("about:blank")
+            reset = True
+        except Exception:
+            pass
+        finally:
+            # The slot always goes back, even when cancelled mid-reset; a page
+            # that could not be reset is dropped and reopened on demand.
+            self._slots.put_nowait(page if reset else None)
+            if not reset:
+                with suppress(Exception):
+                    await page.close()
+
+    async def close(self) -> None:
+        # A launch whose callers were all cancelled would otherwise keep
+        # running after close() and hold the event loop open; cancel it and
+        # let its own cleanup finish before tearing down.
+        starting, self._starting = self._starting, None
+        if starting is not None and not starting.done():
+            starting.cancel()
+        if starting is not None:
+            with suppress(asyncio.CancelledError, Exception):
+                await starting
+        while not self._slots.empty():
+            page = self._slots.get_nowait()
+            if page is not None:
+                with suppress(Exception):
+                    await page.close()
+        await self._teardown()
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_spaces_cached(value: str) -> str:
+    return WHITESPACE_RE.sub(" ", value.replace("\xa0", " ")).strip()
+
+
 def clean_spaces(value: str) -> str:
-    return re.sub(r"\s+", " ", value.replace("\xa0", " ")).strip()
+    # Only short fragments (labels, counters, prices) repeat between calls;
+    # whole-page text would just pin large strings in the cache.
+    if len(value) <= CLEAN_SPACES_CACHE_MAX_LEN:
+        return _clean_spaces_cached(value)
+    return WHITESPACE_RE.sub(" ", value.replace("\xa0", " ")).strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern[str]:
+    return re.compile(pattern, flags)
 
 
 def _clean_ws(value: str) -> str:
     return clean_spaces(value)
 
 
+def html_to_text(html: str) -> str:
+    html = HTML_SKIP_BLOCK_RE.sub(" ", html)
+    html = HTML_TAG_RE.sub(" ", html)
+    return clean_spaces(unescape(html))
+
+
 def parse_compact_number(value: str) -> Optional[str]:
     value = _clean_ws(value or "")
     if not value:
         return None
 
-    match = re.search(r"\d[\d\s\u00a0.,]*(?:\s*(?:k|m|тыс\.?|млн\.?))?", value, flags=re.IGNORECASE)
+    match = COMPACT_NUMBER_RE.search(value)
     if not match:
         return None
 
@@ -98,10 +443,10 @@ def parse_compact_number(value: str) -> Optional[str]:
         token = token[:-1]
     elif lower.endswith("тыс") or lower.endswith("тыс."):
         multiplier = 1_000
-        token = re.sub(r"тыс\.?$", "", token, flags=re.IGNORECASE)
+        token = THOUSANDS_SUFFIX_RE.sub("", token)
     elif lower.endswith("млн") or lower.endswith("млн."):
         multiplier = 1_000_000
-        token = re.sub(r"млн\.?$", "", token, flags=re.IGNORECASE)
+        token = MILLIONS_SUFFIX_RE.sub("", token)
 
     token = token.strip().replace(",", ".")
     if token.count(".") > 1:
@@ -110,7 +455,7 @@ def parse_compact_number(value: str) -> Optional[str]:
     try:
         number = float(token)
     except ValueError:
-        digits = re.sub(r"\D", "", token)
+        digits = NON_DIGIT_RE.sub("", token)
         return digits or None
 
     return str(int(number * multiplier))
@@ -121,9 +466,9 @@ def parse_poc_timer(value: str) -> Optional[str]:
     if not value:
         return None
 
-    hour = re.search(r"(\d+)\s*h", value, flags=re.IGNORECASE)
-    minute = re.search(r"(\d+)\s*m", value, flags=re.IGNORECASE)
-    second = re.search(r"(\d+)\s*s", value, flags=re.IGNORECASE)
+    hour = POC_HOURS_RE.search(value)
+    minute = POC_MINUTES_RE.search(value)
+    second = POC_SECONDS_RE.search(value)
 
     if not any([hour, minute, second]):
         return None
@@ -138,6 +483,20 @@ def parse_poc_timer(value: str) -> Optional[str]:
     return " ".join(parts)
 
 
+async def scoped_texts(page: Page, selectors: list[str]) -> AsyncIterator[str]:
+    """Yield the first matching container's text, then the whole body text.
+
+    Callers stop as soon as a text yields their value, so the body is only
+    read when the container is missing or does not hold the value.
+    """
+    for sel in selectors:
+        loc = page.locator(sel).first
+        if await loc.count() > 0:
+            yield clean_spaces(await loc.inner_text())
+            break
+    yield clean_spaces(await page.inner_text("body"))
+
+
 async def _extract_card_text_by_label(page: Page, label: str) -> Optional[str]:
     js = """
     ([label]) => {
@@ -186,7 +545,7 @@ async def parse_gonka_validator_dashboard(page: Page) -> Dict[str, Any]:
         if not card_text:
             continue
 
-        cleaned = re.sub(rf"(?i)\b{re.escape(label)}\b", "", card_text).strip()
+        cleaned = _compile(rf"\b{re.escape(label)}\b").sub("", card_text).strip()
         cleaned = _clean_ws(cleaned)
 
         if key == "next_poc":
@@ -230,6 +589,28 @@ def find_near_label(text: str, label_regex: str, value_regex: str, window: int =
     return None
 
 
+def find_numbers_before(text: str, label_re: Any, window: int = 64) -> Dict[str, Optional[str]]:
+    """Return the first number preceding each named label group, in one scan."""
+    found: Dict[str, Optional[str]] = {name: None for name in label_re.groupindex}
+    for label in label_re.finditer(text):
+        if found[label.lastgroup] is not None:
+            continue
+        m = TRAILING_NUMBER_RE.search(text[max(0, label.start() - window) : label.start()])
+        if m:
+            found[label.lastgroup] = clean_spaces(m.group(1))
+            if all(found.values()):
+                break
+    return found
+
+
+async def wait_soft(waiter: Awaitable[Any]) -> bool:
+    try:
+        await waiter
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
 async def goto_soft(page: Page, url: str, timeout_ms: int = 15000) -> tuple[bool, Optional[str]]:
     try:
         resp = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
@@ -244,14 +625,102 @@ async def goto_soft(page: Page, url: str, timeout_ms: int = 15000) -> tuple[bool
         return False, str(exc)
 
 
-async def parse_node(page: Page, url: str) -> NodeMetrics:
+async def get_soft(
+    client: httpx.AsyncClient, url: str, cache: Optional[DiskCache] = None
+) -> tuple[Optional[str], Optional[str]]:
+    if cache:
+        cached = cache.get(url)
+        if cached:
+            return cached.body.decode("utf-8", errors="replace"), None
+
+    try:
+        resp = await client.get(url)
+        if resp.status_code >= 400:
+            return None, f"HTTP {resp.status_code}"
+        if cache and resp.status_code == 200:
+            cache.set(url, resp.status_code, dict(resp.headers), resp.content)
+        return resp.text, None
+    except httpx.TimeoutException:
+        return None, "Timeout"
+    except Exception as exc:
+        return None, str(exc)
+
+
+async def get_json_soft(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    cache: Optional[DiskCache] = None,
+) -> tuple[Optional[Any], Optional[str]]:
+    if cache:
+        cached = cache.get(url)
+        if cached:
+            return json.loads(cached.body), None
+
+    headers = dict(headers or {})
+    known = JSON_ETAGS.get(url)
+    if known:
+        headers["If-None-Match"] = known[0]
+
+    try:
+        resp = await client.get(url, headers=headers)
+        if resp.status_code == 304 and known:
+            return known[1], None
+        if resp.status_code >= 400:
+            return None, f"HTTP {resp.status_code}"
+        data = resp.json()
+    except httpx.TimeoutException:
+        return None, "Timeout"
+    except Exception as exc:
+        return None, str(exc)
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        JSON_ETAGS[url] = (etag, data)
+    if cache and resp.status_code == 200:
+        cache.set(url, resp.status_code, dict(resp.headers), resp.content)
+    return data, None
+
+
+async def probe_node(client: httpx.AsyncClient, url: str) -> Optional[str]:
+    """Return an error only when the node's host cannot be connected to at all."""
+    # Only the response headers are read; any answer, even an error status or
+    # a slow body, means the host is up and the dashboard result decides.
+    try:
+        async with client.stream("GET", f"{url}{NODE_API_PATH}", timeout=httpx.Timeout(30.0, connect=5.0)):
+            pass
+    except httpx.ConnectTimeout:
+        return "Timeout"
+    except httpx.ConnectError as exc:
+        return str(exc) or type(exc).__name__
+    except httpx.HTTPError:
+        pass
+    return None
+
+
+async def parse_node(client: httpx.AsyncClient, pool: PagePool, url: str) -> NodeMetrics:
+    # The node API shares the dashboard's host and port. It is probed while the
+    # dashboard renders, and a refused or timed-out connect cancels the render
+    # instead of waiting out the 60 s navigation timeout.
+    dashboard = asyncio.create_task(run_on_page(pool, lambda page: parse_node_dashboard(page, url)))
+    error = await probe_node(client, url)
+    if error is None or dashboard.done():
+        return await dashboard
+
+    dashboard.cancel()
+    with suppress(asyncio.CancelledError):
+        await dashboard
+    return NodeMetrics(url=url, available=False, error=error)
+
+
+async def parse_node_dashboard(page: Page, url: str) -> NodeMetrics:
     node_url = f"{url}/dashboard/gonka/validator"
     ok, err = await goto_soft(page, node_url, timeout_ms=60000)
     if not ok:
         return NodeMetrics(url=url, available=False, error=err)
 
     await page.wait_for_selector("text=Total Compute Power", timeout=15000)
-    await page.wait_for_timeout(2000)
+    await wait_soft(page.wait_for_function(NODE_READY_JS, timeout=10000))
     stats = await parse_gonka_validator_dashboard(page)
 
     return NodeMetrics(
@@ -269,18 +738,23 @@ async def parse_discord(page: Page) -> DiscordMetrics:
         return DiscordMetrics(error=err)
 
     await page.wait_for_selector(r"text=/в\s*сети|online/i", timeout=20000)
-    await page.wait_for_timeout(2000)
-    html = await page.content()
-    text = clean_spaces(await page.inner_text("body"))
-
-    combined = f"{html} {text}"
-    online_match = re.search(r"(\d[\d\s\u00a0.,]*)\s*(?:в\s*сети|online)", combined, flags=re.IGNORECASE)
-    members_match = re.search(r"(\d[\d\s\u00a0.,]*)\s*(?:участник\w*|members?)", combined, flags=re.IGNORECASE)
+    counts = find_numbers_before(await page.evaluate(DISCORD_COUNTS_JS) or "", DISCORD_LABEL_RE)
+    if all(counts.values()):
+        return DiscordMetrics(online=counts["online"], members=counts["members"])
 
-    online = clean_spaces(online_match.group(1)) if online_match else None
-    members = clean_spaces(members_match.group(1)) if members_match else None
+    html = await page.content()
+    for key, value in find_numbers_before(html, DISCORD_LABEL_RE).items():
+        counts[key] = counts[key] or value
+
+    # The rendered text only matters when the markup did not carry a count.
+    if not all(counts.values()):
+        async for text in scoped_texts(page, DISCORD_TEXT_SELECTORS):
+            for key, value in find_numbers_before(text, DISCORD_LABEL_RE).items():
+                counts[key] = counts[key] or value
+            if all(counts.values()):
+                break
 
-    return DiscordMetrics(online=online, members=members)
+    return DiscordMetrics(online=counts["online"], members=counts["members"])
 
 
 async def parse_x(page: Page) -> XMetrics:
@@ -291,31 +765,33 @@ async def parse_x(page: Page) -> XMetrics:
         return XMetrics(error=str(exc))
 
 
-async def parse_github(page: Page) -> GitHubMetrics:
-    ok, err = await goto_soft(page, GITHUB_URL)
-    if not ok:
+async def parse_github(client: httpx.AsyncClient, cache: Optional[DiskCache] = None) -> GitHubMetrics:
+    repo, err = await get_json_soft(
+        client, GITHUB_API_URL, headers={"Accept": "application/vnd.github+json"}, cache=cache
+    )
+    if repo is not None:
+        stars = repo.get("stargazers_count")
+        return GitHubMetrics(stars=f"{stars:,}" if isinstance(stars, int) else None)
+
+    # The unauthenticated API is rate limited; the repo page still has the count.
+    if err != "HTTP 403":
         return GitHubMetrics(error=err)
+    return await parse_github_html(client, cache)
 
-    await page.wait_for_timeout(1500)
 
-    selectors = [
-        'a[href$="/stargazers"] span.Counter',
-        'a[href$="/stargazers"] strong',
-        'a[href$="/stargazers"]',
-    ]
+async def parse_github_html(client: httpx.AsyncClient, cache: Optional[DiskCache] = None) -> GitHubMetrics:
+    html, err = await get_soft(client, GITHUB_URL, cache)
+    if html is None:
+        return GitHubMetrics(error=err)
+
     stars = None
-    for sel in selectors:
-        loc = page.locator(sel).first
-        if await loc.count() > 0:
-            raw = clean_spaces(await loc.inner_text())
-            m = re.search(r"\d[\d\s.,kKmM]*", raw)
-            if m:
-                stars = clean_spaces(m.group(0))
-                break
+    m = GITHUB_STARS_ATTR_RE.search(html) if "repo-stars-counter-star" in html else None
+    if m:
+        stars = m.group(1)
 
     if not stars:
-        text = clean_spaces(await page.inner_text("body"))
-        m = re.search(r"(\d[\d\s.,kKmM]*)\s*stars?", text, flags=re.IGNORECASE)
+        text = html_to_text(html)
+        m = GITHUB_STARS_TEXT_RE.search(text)
         if m:
             stars = clean_spaces(m.group(1))
 
@@ -340,68 +816,175 @@ async def dismiss_hex_popups(page: Page) -> None:
             pass
 
 
-async def parse_hex(page: Page) -> HexMetrics:
+def find_hex_price(text: str) -> Optional[str]:
+    # Prefer sell/current price markers; stop at the first sell price.
+    found: Dict[str, str] = {}
+    for m in HEX_PRICE_RE.finditer(text):
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if m.lastgroup == "sell":
+            break
+    for key in HEX_PRICE_PRIORITY:
+        if key in found:
+            return found[key].replace(" ", "")
+    return None
+
+
+async def parse_hex(client: httpx.AsyncClient, pool: PagePool, cache: Optional[DiskCache] = None) -> HexMetrics:
+    # The OTC page is usually client-rendered; only start a browser page when
+    # the server HTML does not already carry the price.
+    html, _ = await get_soft(client, HEX_URL, cache)
+    if html:
+        price = find_hex_price(html_to_text(html))
+        if price:
+            return HexMetrics(price=price)
+
+    return await run_on_page(pool, parse_hex_page)
+
+
+async def parse_hex_page(page: Page) -> HexMetrics:
     ok, err = await goto_soft(page, HEX_URL, timeout_ms=30000)
     if not ok:
         return HexMetrics(error=err)
 
-    await page.wait_for_timeout(3000)
+    await wait_soft(page.wait_for_selector(r"text=/\$\s*\d/", timeout=8000))
     await dismiss_hex_popups(page)
-    await page.wait_for_timeout(1000)
 
-    text = clean_spaces(await page.inner_text("body"))
-    price = None
+    # The sell price card is a few dozen bytes; only read the page text when
+    # no card is found.
+    for label in HEX_PRICE_LABELS:
+        card_text = await _extract_card_text_by_label(page, label)
+        price = find_hex_price(card_text) if card_text else None
+        if price:
+            return HexMetrics(price=price)
 
-    # Prefer sell/current price markers.
-    for pattern in [
-        r"(?:Sell\s*Price|Цена\s*продажи)\s*[:]?\s*\$?\s*(\d+(?:[.,]\d+)*)",
-        r"(?:Buy\s*Price|Цена\s*покупки)\s*[:]?\s*\$?\s*(\d+(?:[.,]\d+)*)",
-        r"\$\s*(\d+(?:[.,]\d+)*)",
-    ]:
-        m = re.search(pattern, text, flags=re.IGNORECASE)
-        if m:
-            price = m.group(1).replace(" ", "")
+    price = None
+    async for text in scoped_texts(page, HEX_TEXT_SELECTORS):
+        price = find_hex_price(text)
+        if price:
             break
-
     return HexMetrics(price=price)
 
 
-async def collect(headless: bool = True) -> dict:
-    async with async_playwright() as p:
-        browser: Browser = await p.chromium.launch(headless=headless)
-        context = await browser.new_context(ignore_https_errors=True)
+def is_blocked_request(resource_type: str, url: str) -> bool:
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith(f".{blocked}") for blocked in BLOCKED_HOSTS)
+
+
+def make_route_handler(cache: Optional[DiskCache] = None) -> Callable[[Route], Awaitable[None]]:
+    async def handle_route(route: Route) -> None:
+        request = route.request
+        if is_blocked_request(request.resource_type, request.url):
+            await route.abort()
+            return
+        if not cache or request.method != "GET":
+            await route.continue_()
+            return
+
+        cached = cache.get(request.url)
+        if cached:
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+
+        try:
+            response = await route.fetch(max_redirects=0)
+            body = await response.body()
+        except Exception:
+            await route.continue_()
+            return
+        if response.status == 200:
+            cache.set(request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    return handle_route
 
-        node_metrics: list[NodeMetrics] = []
-        for url in NODE_URLS:
-            page = await context.new_page()
-            node_metrics.append(await parse_node(page, url))
-            await page.close()
 
-        page = await context.new_page()
-        discord = await parse_discord(page)
-        await page.close()
+async def run_on_page(pool: PagePool, parse: Callable[[Page], Awaitable[T]]) -> T:
+    page = await pool.acquire()
+    try:
+        return await parse(page)
+    finally:
+        await pool.release(page)
+
 
-        page = await context.new_page()
-        x_data = await parse_x(page)
-        await page.close()
+SECTIONS = ("nodes", "discord", "x", "github", "hex")
+SECTION_METRICS = {"discord": DiscordMetrics, "x": XMetrics, "github": GitHubMetrics, "hex": HexMetrics}
 
-        page = await context.new_page()
-        github = await parse_github(page)
-        await page.close()
 
-        page = await context.new_page()
-        hex_data = await parse_hex(page)
-        await page.close()
+def section_error(name: str, exc: BaseException) -> Any:
+    if name == "nodes":
+        return [asdict(NodeMetrics(url=url, available=False, error=str(exc))) for url in NODE_URLS]
+    return asdict(SECTION_METRICS[name](error=str(exc)))
 
-        await context.close()
-        await browser.close()
 
+async def collect_section(
+    name: str, client: httpx.AsyncClient, pool: PagePool, cache: Optional[DiskCache] = None
+) -> Any:
+    if name == "nodes":
+        results = await asyncio.gather(*[parse_node(client, pool, url) for url in NODE_URLS], return_exceptions=True)
+        return [
+            asdict(NodeMetrics(url=url, available=False, error=str(item)) if isinstance(item, Exception) else item)
+            for url, item in zip(NODE_URLS, results)
+        ]
+
+    try:
+        if name == "discord":
+            result = await run_on_page(pool, parse_discord)
+        elif name == "x":
+            result = await run_on_page(pool, parse_x)
+        elif name == "github":
+            result = await parse_github(client, cache)
+        else:
+            result = await parse_hex(client, pool, cache)
+    except Exception as exc:
+        return section_error(name, exc)
+    return asdict(result)
+
+
+async def collect(client: httpx.AsyncClient, pool: PagePool, cache: Optional[DiskCache] = None) -> dict:
+    results = await asyncio.gather(*[collect_section(name, client, pool, cache) for name in SECTIONS])
+    return dict(zip(SECTIONS, results))
+
+
+async def run_worker(name: str, args: argparse.Namespace) -> Any:
+    # Each worker gets its own profile: Chromium locks a profile directory to
+    # a single running browser.
+    cmd = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        name,
+        "--profile-dir",
+        f"{args.profile_dir}-{name}",
+        "--cache-ttl",
+        str(args.cache_ttl),
+        "--cache-dir",
+        args.cache_dir,
+    ]
+    if args.show_browser:
+        cmd.append("--show-browser")
+
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=WORKER_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise RuntimeError(f"Worker timed out after {WORKER_TIMEOUT:g} s") from None
+    if proc.returncode != 0:
+        lines = stderr.decode(errors="replace").strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"Worker exited with code {proc.returncode}")
+    return json.loads(stdout)
+
+
+async def collect_in_processes(args: argparse.Namespace) -> dict:
+    results = await asyncio.gather(*[run_worker(name, args) for name in SECTIONS], return_exceptions=True)
     return {
-        "nodes": [asdict(item) for item in node_metrics],
-        "discord": asdict(discord),
-        "x": asdict(x_data),
-        "github": asdict(github),
-        "hex": asdict(hex_data),
+        name: section_error(name, item) if isinstance(item, Exception) else item
+        for name, item in zip(SECTIONS, results)
     }
 
 
@@ -444,17 +1027,179 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Gonka public metrics parser")
     parser.add_argument("--show-browser", action="store_true", help="Run with visible browser window")
     parser.add_argument("--json", action="store_true", help="Output JSON")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0,
+        help="Serve responses from the on-disk cache for this many seconds (0 disables caching)",
+    )
+    parser.add_argument("--cache-dir", default=".cache", help="Directory for the response cache")
+    parser.add_argument(
+        "--profile-dir",
+        default=".pw-profile",
+        help=(
+            "Chromium profile directory reused between runs; if another running browser holds it, "
+            "a temporary non-persistent context is used instead"
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0,
+        help="Keep the browser open and collect again every N seconds (0 runs once)",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Collect each source in its own worker process with its own browser",
+    )
+    parser.add_argument("--worker", choices=SECTIONS, help=argparse.SUPPRESS)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    data = asyncio.run(collect(headless=not args.show_browser))
-    if args.json:
+def output(data: dict, as_json: bool) -> None:
+    if as_json:
         print(json.dumps(data, ensure_ascii=False, indent=2))
     else:
         print_report(data)
 
 
+def environment_proxy_mounts() -> Dict[str, Optional[str]]:
+    """Map mount patterns to proxy URLs (None: connect directly) from the environment.
+
+    Passing transport= turns off httpx's own HTTP(S)_PROXY/ALL_PROXY/NO_PROXY
+    handling, so its rules are reproduced here: a proxy without a scheme gets
+    http://, and NO_PROXY IPs and localhost are matched exactly, IPv6 in
+    brackets, while other names also match their subdomains.
+    """
+    proxies = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        if proxies.get(scheme):
+            proxy = proxies[scheme]
+            mounts[f"{scheme}://"] = proxy if "://" in proxy else f"http://{proxy}"
+
+    for host in (h.strip() for h in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+        elif _is_ip_address(host, ipaddress.IPv4Address) or host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        elif _is_ip_address(host, ipaddress.IPv6Address):
+            mounts[f"all://[{host}]"] = None
+        else:
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+def _is_ip_address(host: str, kind: type) -> bool:
+    try:
+        kind(host.split("/")[0])
+    except ValueError:
+        return False
+    return True
+
+
+def make_http_client() -> httpx.AsyncClient:
+    # One pooled HTTP/2 client for every origin, kept for the whole session so
+    # --interval runs reuse TCP/TLS connections. The transports retry failed
+    # connection attempts only; HTTP error statuses are left to the parsers.
+    def transport(proxy: Optional[str] = None) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=HTTP_CONNECT_RETRIES,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            proxy=proxy,
+        )
+
+    mounts = {
+        pattern: transport(proxy) if proxy else None for pattern, proxy in environment_proxy_mounts().items()
+    }
+
+    return httpx.AsyncClient(
+        transport=transport(),
+        mounts=mounts,
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        headers=HTTP_HEADERS,
+        follow_redirects=True,
+    )
+
+
+async def launch_context(
+    p: Playwright, profile_dir: str, headless: bool = True
+) -> tuple[Optional[Browser], BrowserContext]:
+    # A persistent profile keeps cookies and the HTTP cache between runs, so
+    # scheduled invocations start from a warm browser state. Chromium locks the
+    # profile to one running browser; when an overlapping run holds it, fall
+    # back to a throwaway context instead of failing the whole collection.
+    try:
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=profile_dir,
+            headless=headless,
+            ignore_https_errors=True,
+        )
+        return None, context
+    except PlaywrightError as exc:
+        first_line = str(exc).strip().splitlines()[0] if str(exc).strip() else type(exc).__name__
+        print(
+            f"Could not open persistent profile {profile_dir} ({first_line}); using a temporary context",
+            file=sys.stderr,
+        )
+
+    browser = await p.chromium.launch(headless=headless)
+    return browser, await browser.new_context(ignore_https_errors=True)
+
+
+@asynccontextmanager
+async def open_session(
+    args: argparse.Namespace, pool_size: int = PAGE_POOL_SIZE
+) -> AsyncIterator[tuple[httpx.AsyncClient, PagePool, Optional[DiskCache]]]:
+    cache = DiskCache(args.cache_dir, ttl=args.cache_ttl) if args.cache_ttl > 0 else None
+
+    async with make_http_client() as client:
+        pool = PagePool(args.profile_dir, headless=not args.show_browser, cache=cache, size=pool_size)
+        try:
+            yield client, pool, cache
+        finally:
+            await pool.close()
+
+
+async def repeat(args: argparse.Namespace, collect_once: Callable[[], Awaitable[dict]]) -> None:
+    while True:
+        output(await collect_once(), args.json)
+        if args.interval <= 0:
+            break
+        await asyncio.sleep(args.interval)
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.worker:
+        pool_size = len(NODE_URLS) if args.worker == "nodes" else 1
+        try:
+            async with open_session(args, pool_size) as (client, pool, cache):
+                section = await collect_section(args.worker, client, pool, cache)
+        except Exception as exc:
+            section = section_error(args.worker, exc)
+        print(json.dumps(section, ensure_ascii=False))
+        return
+
+    if args.processes:
+        await repeat(args, lambda: collect_in_processes(args))
+        return
+
+    async with open_session(args) as (client, pool, cache):
+        await repeat(args, lambda: collect(client, pool, cache))
+
+
+def main() -> None:
+    # uvloop's libuv loop cuts per-callback overhead for the concurrent page and
+    # socket traffic; it is optional and unavailable on Windows.
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    runner(run(parse_args()))
+
+
 if __name__ == "__main__":
     main()
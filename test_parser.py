@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+import parser
+
+PROXY_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+@pytest.fixture(autouse=True)
+def clean_proxy_env(monkeypatch):
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+@pytest.mark.parametrize(
+    "env, expected",
+    [
+        ({}, {}),
+        ({"HTTPS_PROXY": "proxy.local:3128"}, {"https://": "http://proxy.local:3128"}),
+        ({"HTTP_PROXY": "socks5://127.0.0.1:1080"}, {"http://": "socks5://127.0.0.1:1080"}),
+        (
+            {"ALL_PROXY": "http://proxy.local:3128", "NO_PROXY": "localhost,127.0.0.1,::1"},
+            {
+                "all://": "http://proxy.local:3128",
+                "all://localhost": None,
+                "all://127.0.0.1": None,
+                "all://[::1]": None,
+            },
+        ),
+        (
+            {"NO_PROXY": "192.168.0.0/16, .example.com,http://intranet"},
+            {"all://192.168.0.0/16": None, "all://*.example.com": None, "http://intranet": None},
+        ),
+        ({"HTTPS_PROXY": "proxy.local:3128", "NO_PROXY": "*"}, {}),
+    ],
+)
+def test_environment_proxy_mounts(monkeypatch, env, expected):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    assert parser.environment_proxy_mounts() == expected
+
+
+def test_make_http_client_accepts_environment_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "proxy.local:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost,127.0.0.1,::1,192.168.0.0/16,.example.com")
+
+    async def build():
+        async with parser.make_http_client():
+            pass
+
+    asyncio.run(build())